@@ -58,9 +58,10 @@ A major complication for collecting test results is that each
 - `teardown` can pass or error (TODO: or warn?) whether the test
   passed or failed
 
-However per `pytest_runtest_protocol`, `pytest_runtest_logfinish` is
-called after running a test, which could be used to aggregate the test
-info collected during `pytest_runtest_logreport`?
+Per `pytest_runtest_protocol`, `pytest_runtest_logfinish` is called
+after running a test, so the info collected during
+`pytest_runtest_logreport` is aggregated in memory and queued as a
+single row there, for the `Writer` thread to store.
 
 A given sessions database transitions through several phases marked by
 updating the `user_version`:
@@ -74,19 +75,83 @@ updating the `user_version`:
 
 """
 
+import contextlib
 import datetime
-import itertools
 import json
+import math
 import os
 import pathlib
+import queue
+import threading
 import typing
-from collections.abc import Container, Generator, Iterable, Iterator
+from collections.abc import (
+    Callable,
+    Container,
+    Generator,
+    Iterable,
+    Iterator,
+)
 
 import pytest
 import sqlite3
 from _pytest._code.code import TracebackStyle
 from _pytest.reports import CollectErrorRepr
 
+try:
+    import orjson
+except ImportError:
+
+    def dumps(report: dict[str, typing.Any]) -> str:
+        return json.dumps(report)
+
+    def loads(report: str) -> typing.Any:
+        return json.loads(report)
+
+else:
+
+    def finite(value: object) -> bool:
+        if isinstance(value, float):
+            return math.isfinite(value)
+        if isinstance(value, dict):
+            return all(map(finite, value.values()))
+        if isinstance(value, (list, tuple)):
+            return all(map(finite, value))
+        return True
+
+    def dumps(report: dict[str, typing.Any]) -> str:
+        """Serializes a report to JSON, using orjson for speed as it is
+        available.
+
+        orjson writes NaN and infinities as ``null``, reports containing
+        them go through json which keeps them. Only user properties are
+        checked: the rest of a report is pytest's, which only has finite
+        durations, plugins adding float attributes to reports are not
+        covered.
+        """
+        if not finite(report.get('user_properties')):
+            return json.dumps(report)
+        try:
+            return orjson.dumps(report).decode()
+        except TypeError:
+            # orjson is stricter than json e.g. it rejects integers
+            # beyond 64 bits, which user properties could contain
+            return json.dumps(report)
+
+    def loads(report: str) -> typing.Any:
+        try:
+            return orjson.loads(report)
+        except ValueError:
+            # e.g. NaN or infinities, which json generates
+            return json.loads(report)
+
+
+def report_json(report: pytest.TestReport | pytest.CollectReport) -> str:
+    data = report._to_json()
+    # under xdist the controller's reports hold the worker they come
+    # from, which is not serializable (nor useful)
+    data.pop('node', None)
+    return dumps(data)
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addini(
@@ -122,10 +187,9 @@ def pytest_configure(config: pytest.Config) -> None:
     if ref := config.getoption('reference'):
         refpath = dbdir / ref
     else:
-        for refpath in sorted(dbdir.glob('session-*'), reverse=True):
-            with sqlite3.connect(refpath) as refcn:
-                if refcn.execute('PRAGMA user_version').fetchone() == (5,):
-                    break
+        for refpath in reversed(session_files(dbdir)):
+            if user_version(refpath) == 5:
+                break
         else:
             refpath = ':memory:'
 
@@ -183,7 +247,7 @@ def pytest_configure(config: pytest.Config) -> None:
         }:
             config.pluginmanager.register(
                 ReorderPlugin(
-                    rp.cn,
+                    rp.writer,
                     reorder,
                 ),
                 'session-reorderplugin',
@@ -221,12 +285,120 @@ CREATE TABLE {schema}.items (
 ) STRICT;
 
 CREATE UNIQUE INDEX {schema}.items_nodeid_idx ON items (nodeid);
-CREATE INDEX {schema}.items_outcome_idx ON items (outcome);
+-- covers the lookup of nodeids by outcome (see `SkipCollection`)
+CREATE INDEX {schema}.items_outcome_nodeid_idx ON items (outcome, nodeid);
 
 PRAGMA {schema}.user_version = 1;
 """)
 
 
+def tune(cn: sqlite3.Connection, *, wal: bool = True) -> None:
+    """Sessions do a lot of tiny writes (several per test), so trade a
+    bit of durability for throughput: WAL with ``synchronous=NORMAL``
+    only syncs on checkpoint rather than on every commit.
+
+    ``wal`` should be disabled for in-memory and read-only connections,
+    as switching the journal mode writes to the database.
+    """
+    if wal:
+        cn.execute("PRAGMA journal_mode = WAL")
+    cn.executescript("""
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+PRAGMA mmap_size = 268435456;
+""")
+
+
+def session_files(dbdir: pathlib.Path) -> list[pathlib.Path]:
+    """Returns the session files in ``dbdir``, oldest first.
+
+    Session names end with their timestamp, which filters out the
+    ``-wal`` and ``-shm`` files of sessions which are still open (or
+    crashed).
+    """
+    return sorted(dbdir.glob('session-*[0-9]'))
+
+
+def user_version(path: pathlib.Path) -> int:
+    """Returns the ``user_version`` of the database at ``path``.
+
+    If the database has no WAL (it's not being written to), reads the
+    version directly from the database header rather than having to
+    open a connection, which would also create (then remove) the WAL
+    sidecars.
+    """
+    if not path.with_name(path.name + '-wal').exists():
+        with path.open('rb') as f:
+            header = f.read(100)
+        if len(header) == 100 and header.startswith(b'SQLite format 3\0'):
+            return int.from_bytes(header[60:64], 'big')
+
+    # the connection's context manager only handles transactions,
+    # an unclosed connection would hold on to the WAL sidecars
+    with contextlib.closing(sqlite3.connect(path)) as cn:
+        [version] = cn.execute('PRAGMA user_version').fetchone()
+        return typing.cast(int, version)
+
+
+class Writer:
+    """Runs statements on a background thread, so the test loop doesn't
+    wait on sqlite (which releases the GIL while it works).
+
+    The connection must only be used directly after a `sync`, as it's
+    shared with the writer thread.
+    """
+
+    def __init__(self, cn: sqlite3.Connection) -> None:
+        self.cn = cn
+        self.queue: queue.SimpleQueue[
+            tuple[Callable[[str, typing.Any], object], str, typing.Any]
+            | threading.Event
+            | None
+        ] = queue.SimpleQueue()
+        self.error: Exception | None = None
+        self.thread = threading.Thread(
+            target=self.run, name='pytest-sessions-writer', daemon=True
+        )
+        self.thread.start()
+
+    def run(self) -> None:
+        while (job := self.queue.get()) is not None:
+            if isinstance(job, threading.Event):
+                job.set()
+            elif self.error is None:
+                # stop writing after a failure, it's raised by `sync`
+                method, sql, params = job
+                try:
+                    method(sql, params)
+                # not just sqlite3.Error, binding can raise e.g.
+                # OverflowError, and anything escaping kills the thread
+                # leaving `sync` waiting forever
+                except Exception as e:  # noqa: BLE001
+                    self.error = e
+
+    def execute(self, sql: str, params: typing.Any = ()) -> None:
+        self.queue.put((self.cn.execute, sql, params))
+
+    def executemany(self, sql: str, params: Iterable[typing.Any]) -> None:
+        self.queue.put((self.cn.executemany, sql, list(params)))
+
+    def sync(self) -> None:
+        """Waits until the queued statements have run, and raises the
+        error of the first failed one if any.
+        """
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait()
+        if (error := self.error) is not None:
+            self.error = None
+            raise error
+
+    def close(self) -> None:
+        self.queue.put(None)
+        self.thread.join()
+
+
 class SessionPlugin:
     def __init__(self, config: pytest.Config) -> None:
         assert config.cache is not None, "cacheprovider must be enabled"
@@ -236,15 +408,33 @@ class SessionPlugin:
         self.session_name = self.dbdir / datetime.datetime.now().strftime(
             'session-%Y%m%d%H%M%S%f'
         )
+        # xdist workers relay their reports to the controller, which
+        # records the session, but `RerunPlugin` still needs a database
+        worker = hasattr(config, 'workerinput')
         self.cn = sqlite3.connect(
-            self.session_name, timeout=0.0, isolation_level=None
+            ':memory:' if worker else self.session_name,
+            timeout=0.0,
+            isolation_level=None,
+            check_same_thread=False,
         )
+        tune(self.cn, wal=not worker)
         init_db(self.cn)
+        self.writer = Writer(self.cn)
+        # rows of the tests being run, keyed by nodeid
+        self.reports: dict[str, dict[str, typing.Any]] = {}
 
     def pytest_sessionstart(self, session: pytest.Session) -> None:
         self.session = session
 
-    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+    @pytest.hookimpl(wrapper=True)
+    def pytest_sessionfinish(
+        self, session: pytest.Session
+    ) -> Generator[None, None, None]:
+        # an interrupted test never reaches `pytest_runtest_logfinish`
+        self.flush()
+        yield
+        self.writer.sync()
+
         config = self.config
         if config.getoption("cacheshow") or hasattr(config, "workerinput"):
             return
@@ -252,14 +442,25 @@ class SessionPlugin:
         if config.getoption("collectonly"):
             return
 
-        self.cn.execute("ANALYZE")
-        self.cn.execute("PRAGMA user_version = 5;")
+        with self.cn:
+            self.cn.execute("BEGIN")
+            # only analyzes if it looks worthwhile, unlike a straight
+            # ANALYZE which always scans every index, restricted to
+            # main as the reference is attached to the same connection
+            self.cn.execute("PRAGMA main.optimize")
+            self.cn.execute("PRAGMA user_version = 5;")
         limit = session.config.getini("sessions_limit")
         # TODO: in case of concurrent sessions, should not take
         #       pending sessions (user_version < 5) in account
-        sessionfiles = sorted(self.dbdir.glob("session-*"))
-        for dbfile in sessionfiles[:-limit]:
-            dbfile.unlink(missing_ok=True)
+        for dbfile in session_files(self.dbdir)[:-limit]:
+            for suffix in ('', '-wal', '-shm'):
+                dbfile.with_name(dbfile.name + suffix).unlink(missing_ok=True)
+
+    def pytest_unconfigure(self) -> None:
+        # closing the last connection checkpoints the WAL and removes
+        # the sidecar files
+        self.writer.close()
+        self.cn.close()
 
     @pytest.hookimpl(tryfirst=True)
     def pytest_collection_modifyitems(
@@ -268,9 +469,13 @@ class SessionPlugin:
         config: pytest.Config,
         items: list[pytest.Item],
     ) -> None:
-        self.cn.executemany(
-            "INSERT INTO items (nodeid, outcome) VALUES (?, 'pending')",
-            [[it.nodeid] for it in items],
+        # a single statement regardless of the number of items
+        self.writer.execute(
+            """
+            INSERT INTO items (nodeid, outcome)
+            SELECT value, 'pending' FROM json_each(?)
+            """,
+            [json.dumps([it.nodeid for it in items])],
         )
 
     def pytest_collectreport(self, report: pytest.CollectReport) -> None:
@@ -280,7 +485,7 @@ class SessionPlugin:
             outcome = "skipped"
         else:
             return
-        self.cn.execute(
+        self.writer.execute(
             """
             INSERT INTO items (nodeid, outcome, collect)
             VALUES (?, ?, ?)
@@ -290,7 +495,7 @@ class SessionPlugin:
             [
                 report.nodeid,
                 outcome,
-                json.dumps(report._to_json()),
+                report_json(report),
             ],
         )
 
@@ -306,7 +511,7 @@ class SessionPlugin:
         if not nodeid or when != 'runtest':
             return
 
-        self.cn.execute(
+        self.writer.execute(
             "UPDATE items SET outcome = 'warnings' WHERE nodeid = ?",
             [nodeid],
         )
@@ -314,10 +519,58 @@ class SessionPlugin:
     def pytest_runtest_logstart(
         self, nodeid: str, location: tuple[str, int | None, str]
     ) -> None:
-        self.cn.execute(
-            "UPDATE items SET filename = ?, lineno = ?, testname = ? WHERE nodeid = ?",
-            [*location, nodeid],
+        self.reports[nodeid] = self.new_row(nodeid, *location)
+
+    def pytest_runtest_logfinish(self) -> None:
+        self.flush()
+
+    @staticmethod
+    def new_row(
+        nodeid: str,
+        filename: str | None = None,
+        lineno: int | None = None,
+        testname: str | None = None,
+    ) -> dict[str, typing.Any]:
+        return {
+            'nodeid': nodeid,
+            'outcome': 'pending',
+            'setup': None,
+            'call': None,
+            'teardown': None,
+            'filename': filename,
+            'lineno': lineno,
+            'testname': testname,
+        }
+
+    def flush(self) -> None:
+        """Writes out the rows of tests run since the last flush, as a
+        single upsert per test.
+        """
+        if not self.reports:
+            return
+
+        self.writer.executemany(
+            """
+            INSERT INTO items (
+                nodeid, outcome, setup, call, teardown,
+                filename, lineno, testname
+            )
+            VALUES (
+                :nodeid, :outcome, :setup, :call, :teardown,
+                :filename, :lineno, :testname
+            )
+            ON CONFLICT
+            DO UPDATE SET outcome = excluded.outcome,
+                          setup = coalesce(excluded.setup, setup),
+                          call = coalesce(excluded.call, call),
+                          teardown = coalesce(excluded.teardown, teardown),
+                          filename = coalesce(excluded.filename, filename),
+                          lineno = coalesce(excluded.lineno, lineno),
+                          testname = coalesce(excluded.testname, testname)
+            """,
+            self.reports.values(),
         )
+        self.reports.clear()
 
     def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
         # TODO: review this, it's called for each phase (setup, call,
@@ -337,15 +590,13 @@ class SessionPlugin:
         ):
             outcome = "error"
 
-        self.cn.execute(
-            "UPDATE items SET outcome = ? WHERE nodeid = ? AND outcome in ('pending', 'passed')",
-            [outcome, report.nodeid],
-        )
+        row = self.reports.get(report.nodeid)
+        if row is None:
+            row = self.reports[report.nodeid] = self.new_row(report.nodeid)
+        if row['outcome'] in ('pending', 'passed'):
+            row['outcome'] = outcome
         if (when := report.when) in ('setup', 'call', 'teardown'):
-            self.cn.execute(
-                f"UPDATE items SET {when} = ? WHERE nodeid = ?",
-                [json.dumps(report._to_json()), report.nodeid],
-            )
+            row[when] = report_json(report)
 
 
 class RerunPlugin:
@@ -360,9 +611,10 @@ class RerunPlugin:
     ) -> None:
         self.skipped_files = 0
         self.config: pytest.Config = session.config
-        self.cn = sqlite3.connect(
-            session.session_name, timeout=0.0, isolation_level=None
-        )
+        # share the session's connection (and page cache), it's only
+        # used directly during configuration, before anything is queued
+        self.cn = session.cn
+        self.writer = session.writer
         self.cn.execute("ATTACH ? AS reference", [reference])
         if reference == ':memory:':
             init_db(self.cn, schema='reference')
@@ -382,35 +634,35 @@ class RerunPlugin:
             self.rerun = None
         self.all_if_none = all_if_none
 
+        # outcomes of the reference session, only needed for filtering
+        self.previous: dict[str, str] = {}
+        if self.rerun:
+            self.previous = dict(
+                self.cn.execute("SELECT nodeid, outcome FROM reference.items")
+            )
+
     def pytest_collection_modifyitems(
         self,
         config: pytest.Config,
         items: list[pytest.Item],
     ) -> None:
-        self.cn.execute("""
-        INSERT INTO main.items
-            SELECT *
-            FROM reference.items
-            WHERE true
-        ON CONFLICT DO NOTHING
-        """)
         if not self.rerun:
             return
 
-        prev = dict(
-            self.cn.execute("""
-        SELECT main.items.nodeid, coalesce(reference.items.outcome, 'new')
-        FROM main.items
-        LEFT JOIN reference.items ON (main.items.nodeid = reference.items.nodeid)
-        """)
-        )
+        prev = self.previous
         kept = []
         deselected = []
+        # previous runstate of deselected tests, see below
+        updates = []
         for item in items:
-            if prev[item.nodeid] in self.rerun:
+            nodeid = item.nodeid
+            outcome = prev.get(nodeid, 'new')
+            if outcome in self.rerun:
                 kept.append(item)
             else:
                 deselected.append(item)
+                if outcome != 'new':
+                    updates.append((outcome, nodeid))
         if kept or not self.all_if_none:
             config.hook.pytest_deselected(items=deselected)
             items[:] = kept
@@ -418,18 +670,32 @@ class RerunPlugin:
             # carry forwards the previous runstate of existing
             # collected but deselected tests, otherwise it gets
             # forgotten and the next session sees them as new again
-            if updates := [
-                (outcome, item.nodeid)
-                for item in deselected
-                if (outcome := prev[item.nodeid]) != 'new'
-            ]:  # fmt: skip
-                self.cn.executemany(
-                    "UPDATE main.items SET outcome = ? WHERE nodeid = ?",
-                    updates,
+            if updates:
+                # a single statement regardless of the number of updates
+                self.writer.execute(
+                    """
+                    UPDATE main.items SET outcome = v.outcome
+                    FROM (
+                        SELECT json_extract(value, '$[0]') AS outcome,
+                               json_extract(value, '$[1]') AS nodeid
+                        FROM json_each(?)
+                    ) v
+                    WHERE main.items.nodeid = v.nodeid
+                    """,
+                    [json.dumps(updates)],
                 )
 
     def pytest_sessionfinish(self, session: pytest.Session) -> None:
-        self.cn.execute("""
+        # bring over the tests which were not collected this time
+        # around, done last so it doesn't hold up collection
+        self.writer.execute("""
+        INSERT INTO main.items
+            SELECT *
+            FROM reference.items
+            WHERE true
+        ON CONFLICT DO NOTHING
+        """)
+        self.writer.execute("""
         UPDATE main.items
         SET outcome = reference.items.outcome
         FROM reference.items
@@ -443,6 +709,8 @@ class ShowSessionPlugin:
     def __init__(self, config: pytest.Config, reference: str) -> None:
         self.config = config
         self.cn = sqlite3.connect(reference, timeout=0.0)
+        # only ever read from, so leave the journal mode alone
+        tune(self.cn, wal=False)
         # mapping interface is a lot more convenient than tuples here
         self.cn.row_factory = sqlite3.Row
 
@@ -452,11 +720,11 @@ class ShowSessionPlugin:
     ) -> typing.Literal[True]:
         for row in self.cn.execute(
             "SELECT * FROM items WHERE collect IS NOT NULL"
-        ):
+        ).fetchall():
             assert row['outcome'] in ('failed', 'skipped'), \
                 "pytest_collectreport only stores collection skipping or failure"  # fmt: skip
 
-            report = pytest.CollectReport._from_json(json.loads(row['collect']))
+            report = pytest.CollectReport._from_json(loads(row['collect']))
             if isinstance(report.longrepr, list):
                 # apparently `CollectReport._from_json` does not deserialize tuple longrepr correctly
                 report.longrepr = tuple(report.longrepr)
@@ -526,13 +794,13 @@ class ShowSessionPlugin:
         logfinish = self.config.hook.pytest_runtest_logfinish
         for row in self.cn.execute(
             "SELECT * FROM items WHERE nodeid LIKE '%::%'"
-        ):
+        ).fetchall():
             location = row['filename'], row['lineno'], row['testname']
             logstart(nodeid=row['nodeid'], location=location)
 
             for phase in ('setup', 'call', 'teardown'):
                 if (r := row[phase]) is not None:
-                    report = pytest.TestReport._from_json(json.loads(r))
+                    report = pytest.TestReport._from_json(loads(r))
                     # apparently `BaseReport._from_json` does not handle longrepr correctly
                     if isinstance(report.longrepr, list):
                         report.longrepr = tuple(report.longrepr)
@@ -593,13 +861,15 @@ class SkipCollection:
         report = yield
         if isinstance(collector, (pytest.Session, pytest.Directory)):
             report.result.sort(
-                key=lambda node: node.path in self.trie,
+                key=lambda node: self.trie.contains_path(node.path),
                 reverse=True,
             )
-        elif isinstance(collector, pytest.File) and collector.path in self.trie:
+        elif isinstance(collector, pytest.File) and self.trie.contains_path(
+            collector.path
+        ):
             nodes = report.result
             if not self.found_failure:
-                if not any(x.nodeid in self.trie for x in nodes):
+                if not any(self.trie.contains_nodeid(x.nodeid) for x in nodes):
                     return report
 
                 self.config.pluginmanager.register(
@@ -612,7 +882,7 @@ class SkipCollection:
             nodes[:] = [
                 node
                 for node in nodes
-                if node.nodeid in self.trie
+                if self.trie.contains_nodeid(node.nodeid)
                 or session.isinitpath(node.path)
                 or isinstance(node, pytest.Collector)
             ]
@@ -630,7 +900,7 @@ class SkipCollected:
         collector: pytest.Collector,
     ) -> pytest.CollectReport | None:
         if isinstance(collector, pytest.File):
-            if collector.path not in self.trie:
+            if not self.trie.contains_path(collector.path):
                 self.parent.skipped_paths += 1
 
                 return pytest.CollectReport(
@@ -639,41 +909,52 @@ class SkipCollected:
         return None
 
 
-Trie = dict[str, 'Trie']
+Segments = tuple[str, ...]
 
 
 class IdTrie(Container[pathlib.Path | str]):
+    """Prefix set of nodeids: a path or nodeid is contained if its
+    segments are a prefix of the segments of one of the nodeids.
+
+    Rather than an actual trie, stores every prefix of the nodeids'
+    segments in a flat set, so lookups are a single hashing.
+    """
+
     def __init__(self, rootpath: pathlib.Path, nodeids: Iterable[str]) -> None:
         self.rootpath = rootpath
-        self.d: Trie = {}
-        for nodeid in nodeids:
-            d = self.d
-            for k in self.id_to_path(nodeid):
-                d = d.setdefault(k, {})
+        self.rootparts = rootpath.parts
+        self.prefixes: frozenset[Segments] = frozenset(
+            segments[:i]
+            for segments in map(self.id_to_path, nodeids)
+            for i in range(len(segments) + 1)
+        )
 
     def __bool__(self) -> bool:
-        return bool(self.d)
+        return bool(self.prefixes)
 
     @staticmethod
-    def id_to_path(nodeid: str) -> Iterator[str]:
+    def id_to_path(nodeid: str) -> Segments:
         path, *symbols = nodeid.split('::')
-        return itertools.chain(pathlib.Path(path).parts, symbols)
+        return (*pathlib.PurePath(path).parts, *symbols)
 
     def __contains__(self, item: object) -> bool:
         if isinstance(item, pathlib.Path):
-            item = os.fspath(item.relative_to(self.rootpath))
+            return self.contains_path(item)
         assert isinstance(item, str)
-        d: Trie | None = self.d
-        for segment in self.id_to_path(item):
-            if d is None:
-                return False
-            d = d.get(segment)
-        return d is not None
+        return self.contains_nodeid(item)
+
+    def contains_path(self, path: pathlib.Path) -> bool:
+        parts = path.parts
+        root = len(self.rootparts)
+        return parts[:root] == self.rootparts and parts[root:] in self.prefixes
+
+    def contains_nodeid(self, nodeid: str) -> bool:
+        return self.id_to_path(nodeid) in self.prefixes
 
 
 class ReorderPlugin:
-    def __init__(self, cn: sqlite3.Connection, reorder: dict[str, int]) -> None:
-        self.cn = cn
+    def __init__(self, writer: Writer, reorder: dict[str, int]) -> None:
+        self.writer = writer
         self.reorder = reorder
 
     @pytest.hookimpl(wrapper=True, tryfirst=True)
@@ -682,16 +963,21 @@ class ReorderPlugin:
     ) -> Iterator[None]:
         res = yield
 
+        self.writer.sync()
         prev = dict(
-            self.cn.execute("""
-        SELECT coalesce(main.items.nodeid, reference.items.nodeid),
-               coalesce(reference.items.outcome, 'new')
-        FROM main.items FULL OUTER JOIN reference.items
-          ON (main.items.nodeid = reference.items.nodeid)
-        """)
+            self.writer.cn.execute(
+                """
+                SELECT nodeid, outcome
+                FROM reference.items
+                WHERE nodeid IN (SELECT value FROM json_each(?))
+                """,
+                [json.dumps([it.nodeid for it in items])],
+            )
         )
+        # stat each file once, rather than once per test it contains
+        mtimes = {p: p.stat().st_mtime_ns for p in {it.path for it in items}}
         items.sort(key=lambda it: (
-            self.reorder.get(prev[it.nodeid], 99),
-            -it.path.stat().st_mtime,
+            self.reorder.get(prev.get(it.nodeid, 'new'), 99),
+            -mtimes[it.path],
         ))  # fmt: skip
         return res
@@ -1 +1,50 @@
+import contextlib
+import pathlib
+import sqlite3
+from collections.abc import Callable, Iterator
+
+import pytest
+
 pytest_plugins = 'pytester'
+
+
+@pytest.fixture(scope='session', autouse=True)
+def dont_write_bytecode() -> Iterator[None]:
+    """Several tests rewrite a test file between runs, the new version
+    can have the same size and mtime (within the same second) as the
+    old, so a cached pyc would be considered valid.
+
+    Sets both the flag for in-process runs and the environment for
+    subprocess ones.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('sys.dont_write_bytecode', True)
+        mp.setenv('PYTHONDONTWRITEBYTECODE', '1')
+        yield
+
+
+@pytest.fixture
+def sessions_dir(pytester: pytest.Pytester) -> pathlib.Path:
+    """Directory where the pytester runs store their sessions."""
+    return pytester.path / '.pytest_cache' / 'd' / 'sessions'
+
+
+@pytest.fixture
+def session_db() -> Iterator[Callable[[pathlib.Path], sqlite3.Connection]]:
+    """Opens recorded sessions for reading, closed on teardown.
+
+    The sessions are complete so they're opened as immutable, sqlite
+    then skips locking and doesn't look for (or create) a WAL.
+    """
+    with contextlib.ExitStack() as stack:
+
+        def connect(path: pathlib.Path) -> sqlite3.Connection:
+            return stack.enter_context(
+                contextlib.closing(
+                    sqlite3.connect(
+                        f"{path.as_uri()}?mode=ro&immutable=1", uri=True
+                    )
+                )
+            )
+
+        yield connect
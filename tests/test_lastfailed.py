@@ -2,20 +2,61 @@
 import os
 import sqlite3
 import shutil
+from contextlib import closing
 from pathlib import Path
 from typing import Any, Sequence
 
 import pytest
-from pytest import ExitCode, MonkeyPatch, Pytester
+from pytest import ExitCode, MonkeyPatch, Pytester, RunResult
+
+from pytest_sessions import session_files
+
+# failure of the import or the test is controlled through the
+# environment, so the file doesn't have to be rewritten between runs
+TEST_MAYBE = """
+import os
+env = os.environ
+if '1' == env['FAILIMPORT']:
+    raise ImportError('fail')
+def test_hello():
+    assert '0' == env['FAILTEST']
+"""
+TEST_MAYBE2 = """
+import os
+env = os.environ
+if '1' == env['FAILIMPORT']:
+    raise ImportError('fail')
+
+def test_hello():
+    assert '0' == env['FAILTEST']
+
+def test_pass():
+    pass
+"""
+
+
+def last_failed(pytester: Pytester) -> list[str]:
+    """Returns the failed (or errored) nodeids of the last session."""
+    sessions = pytester.path / ".pytest_cache" / "d" / "sessions"
+    with closing(sqlite3.connect(session_files(sessions)[-1])) as cn:
+        return [
+            nodeid
+            for [nodeid] in cn.execute(
+                "select nodeid from items where outcome in ('failed', 'error') order by nodeid"
+            )
+        ]
+
+
+def runq(pytester: Pytester, *args: str | os.PathLike[str]) -> RunResult:
+    """Runs pytest quietly, for checks which only need the summary."""
+    return pytester.runpytest("-q", "--no-header", *args)
 
 
 class TestLastFailed:
     def test_lastfailed_usecase(
         self,
         pytester: Pytester,
-        monkeypatch: MonkeyPatch,
     ) -> None:
-        monkeypatch.setattr("sys.dont_write_bytecode", True)
         p = pytester.makepyfile(
             """
             def test_1(): assert 0
@@ -23,7 +64,7 @@ class TestLastFailed:
             def test_3(): assert 1
             """
         )
-        result = pytester.runpytest(str(p))
+        result = runq(pytester, str(p))
         result.stdout.fnmatch_lines(["*2 failed*"])
         p = pytester.makepyfile(
             """
@@ -48,16 +89,17 @@ class TestLastFailed:
                 "*1 failed*2 passed*",
             ]
         )
-        pytester.path.joinpath(".pytest_cache", ".git").mkdir(parents=True)
-        result = pytester.runpytest(str(p), "--lf", "--cache-clear")
+        cache_dir = pytester.path / ".pytest_cache"
+        git_dir = cache_dir / ".git"
+        git_dir.mkdir(parents=True)
+        result = runq(pytester, str(p), "--lf", "--cache-clear")
         result.stdout.fnmatch_lines(["*1 failed*2 passed*"])
-        assert pytester.path.joinpath(".pytest_cache", "README.md").is_file()
-        assert pytester.path.joinpath(".pytest_cache", ".git").is_dir()
+        assert (cache_dir / "README.md").is_file()
+        assert git_dir.is_dir()
 
         # Run this again to make sure clear-cache is robust
-        if os.path.isdir(".pytest_cache"):
-            shutil.rmtree(".pytest_cache")
-        result = pytester.runpytest("--lf", "--cache-clear")
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        result = runq(pytester, "--lf", "--cache-clear")
         result.stdout.fnmatch_lines(["*1 failed*2 passed*"])
 
     def test_failedfirst_order(self, pytester: Pytester) -> None:
@@ -96,9 +138,7 @@ class TestLastFailed:
     def test_lastfailed_difference_invocations(
         self,
         pytester: Pytester,
-        monkeypatch: MonkeyPatch,
     ) -> None:
-        monkeypatch.setattr("sys.dont_write_bytecode", True)
         pytester.makepyfile(
             test_a="""
                 def test_a1(): assert 0
@@ -109,14 +149,11 @@ class TestLastFailed:
         p = pytester.path.joinpath("test_a.py")
         p2 = pytester.path.joinpath("test_b.py")
 
-        result = pytester.runpytest()
-        result.stdout.fnmatch_lines(["*2 failed*"])
-        result = pytester.runpytest("--lf", p2)
-        result.stdout.fnmatch_lines(["*1 failed*"])
+        pytester.inline_run().assertoutcome(passed=1, failed=2)
+        pytester.inline_run("--lf", p2).assertoutcome(failed=1)
 
         pytester.makepyfile(test_b="def test_b1(): assert 1")
-        result = pytester.runpytest("--lf", p2)
-        result.stdout.fnmatch_lines(["*1 passed*"])
+        pytester.inline_run("--lf", p2).assertoutcome(passed=1)
         result = pytester.runpytest("--lf", p)
         result.stdout.fnmatch_lines(
             [
@@ -129,19 +166,14 @@ class TestLastFailed:
     def test_lastfailed_usecase_splice(
         self,
         pytester: Pytester,
-        monkeypatch: MonkeyPatch,
     ) -> None:
-        monkeypatch.setattr("sys.dont_write_bytecode", True)
         pytester.makepyfile(
             "def test_1(): assert 0", test_something="def test_2(): assert 0"
         )
         p2 = pytester.path.joinpath("test_something.py")
-        result = pytester.runpytest()
-        result.stdout.fnmatch_lines(["*2 failed*"])
-        result = pytester.runpytest("--lf", p2)
-        result.stdout.fnmatch_lines(["*1 failed*"])
-        result = pytester.runpytest("--lf")
-        result.stdout.fnmatch_lines(["*2 failed*"])
+        pytester.inline_run().assertoutcome(failed=2)
+        pytester.inline_run("--lf", p2).assertoutcome(failed=1)
+        pytester.inline_run("--lf").assertoutcome(failed=2)
 
     def test_lastfailed_xpass(self, pytester: Pytester) -> None:
         pytester.inline_runsource(
@@ -152,10 +184,7 @@ class TestLastFailed:
                 assert 1
         """
         )
-        config = pytester.parseconfigure()
-        assert config.cache is not None
-        lastfailed = config.cache.get("cache/lastfailed", -1)
-        assert lastfailed == -1
+        assert last_failed(pytester) == []
 
     def test_non_serializable_parametrize(self, pytester: Pytester) -> None:
         """Test that failed parametrized tests with unmarshable parameters
@@ -172,7 +201,7 @@ class TestLastFailed:
                 assert False
         """
         )
-        result = pytester.runpytest()
+        result = runq(pytester)
         result.stdout.fnmatch_lines(["*1 failed in*"])
 
     @pytest.mark.xfail(
@@ -269,31 +298,14 @@ class TestLastFailed:
         pytester: Pytester,
         monkeypatch: MonkeyPatch,
     ) -> None:
-        pytester.makepyfile(
-            test_maybe="""
-            import os
-            env = os.environ
-            if '1' == env['FAILIMPORT']:
-                raise ImportError('fail')
-            def test_hello():
-                assert '0' == env['FAILTEST']
-        """
-        )
+        pytester.makepyfile(test_maybe=TEST_MAYBE)
 
         def rlf(fail_import: int, fail_run: int) -> Any:
             monkeypatch.setenv("FAILIMPORT", str(fail_import))
             monkeypatch.setenv("FAILTEST", str(fail_run))
 
             pytester.runpytest("-q")
-            config = pytester.parseconfigure()
-            assert config.cache is not None
-            dbfile = sorted(config.cache.mkdir('sessions').iterdir())[-1]
-            return [
-                nodeid
-                for [nodeid] in sqlite3.connect(dbfile).execute(
-                    "select nodeid from items where outcome in ('failed', 'error')"
-                )
-            ] or -1
+            return last_failed(pytester) or -1
 
         lastfailed = rlf(fail_import=0, fail_run=0)
         assert lastfailed == -1
@@ -312,31 +324,7 @@ class TestLastFailed:
         pytester: Pytester,
         monkeypatch: MonkeyPatch,
     ) -> None:
-        pytester.makepyfile(
-            test_maybe="""
-            import os
-            env = os.environ
-            if '1' == env['FAILIMPORT']:
-                raise ImportError('fail')
-            def test_hello():
-                assert '0' == env['FAILTEST']
-        """
-        )
-
-        pytester.makepyfile(
-            test_maybe2="""
-            import os
-            env = os.environ
-            if '1' == env['FAILIMPORT']:
-                raise ImportError('fail')
-
-            def test_hello():
-                assert '0' == env['FAILTEST']
-
-            def test_pass():
-                pass
-        """
-        )
+        pytester.makepyfile(test_maybe=TEST_MAYBE, test_maybe2=TEST_MAYBE2)
 
         def rlf(
             fail_import: int,
@@ -347,17 +335,7 @@ class TestLastFailed:
             monkeypatch.setenv("FAILTEST", str(fail_run))
 
             result = pytester.runpytest("-q", "--lf", *args)
-            config = pytester.parseconfigure()
-            assert config.cache is not None
-            lastfailed = config.cache.get("cache/lastfailed", -1)
-            dbfile = sorted(config.cache.mkdir('sessions').iterdir())[-1]
-            lastfailed = [
-                nodeid
-                for [nodeid] in sqlite3.connect(dbfile).execute(
-                    "select nodeid from items where outcome in ('failed', 'error')"
-                )
-            ] or -1
-            return result, lastfailed
+            return result, last_failed(pytester) or -1
 
         result, lastfailed = rlf(fail_import=0, fail_run=0)
         assert lastfailed == -1
@@ -387,19 +365,22 @@ class TestLastFailed:
         self, pytester: Pytester
     ) -> None:
         # Issue #1342
+        lastfailed = (
+            pytester.path / ".pytest_cache" / "v" / "cache" / "lastfailed"
+        )
         pytester.makepyfile(test_empty="")
         pytester.runpytest("-q", "--lf")
-        assert not os.path.exists(".pytest_cache/v/cache/lastfailed")
+        assert not lastfailed.exists()
 
         pytester.makepyfile(
             test_successful="def test_success():\n    assert True"
         )
         pytester.runpytest("-q", "--lf")
-        assert not os.path.exists(".pytest_cache/v/cache/lastfailed")
+        assert not lastfailed.exists()
 
         pytester.makepyfile(test_errored="def test_error():\n    assert False")
         pytester.runpytest("-q", "--lf")
-        assert os.path.exists(".pytest_cache/v/cache/lastfailed")
+        assert lastfailed.exists()
 
     def test_xfail_not_considered_failure(self, pytester: Pytester) -> None:
         pytester.makepyfile(
@@ -409,9 +390,8 @@ class TestLastFailed:
             def test(): assert 0
         """
         )
-        result = pytester.runpytest()
-        result.stdout.fnmatch_lines(["*1 xfailed*"])
-        assert self.get_cached_last_failed(pytester) == []
+        pytester.runpytest().assert_outcomes(xfailed=1)
+        assert last_failed(pytester) == []
 
     def test_xfail_strict_considered_failure(self, pytester: Pytester) -> None:
         pytester.makepyfile(
@@ -421,9 +401,8 @@ class TestLastFailed:
             def test(): pass
         """
         )
-        result = pytester.runpytest()
-        result.stdout.fnmatch_lines(["*1 failed*"])
-        assert self.get_cached_last_failed(pytester) == [
+        pytester.inline_run().assertoutcome(failed=1)
+        assert last_failed(pytester) == [
             "test_xfail_strict_considered_failure.py::test"
         ]
 
@@ -439,11 +418,11 @@ class TestLastFailed:
             def test(): assert 0
         """
         )
-        result = pytester.runpytest()
-        assert self.get_cached_last_failed(pytester) == [
+        reprec = pytester.inline_run()
+        assert last_failed(pytester) == [
             "test_failed_changed_to_xfail_or_skip.py::test"
         ]
-        assert result.ret == 1
+        assert reprec.ret == 1
 
         pytester.makepyfile(
             f"""
@@ -452,10 +431,9 @@ class TestLastFailed:
             def test(): assert 0
         """
         )
-        result = pytester.runpytest()
-        assert result.ret == 0
-        assert self.get_cached_last_failed(pytester) == []
-        assert result.ret == 0
+        reprec = pytester.inline_run()
+        assert reprec.ret == 0
+        assert last_failed(pytester) == []
 
     @pytest.mark.xfail(
         reason="should sessions replicate the exact messaging of cacheprovider?"
@@ -482,21 +460,6 @@ class TestLastFailed:
         else:
             assert "rerun previous" in result.stdout.str()
 
-    def get_cached_last_failed(self, pytester: Pytester) -> list[str]:
-        config = pytester.parseconfigure()
-        assert config.cache is not None
-        # `parseconfigure` causes a new `SessionPlugin` to be instantiated which creates a new db...
-        dbfile, to_delete = sorted(config.cache.mkdir("sessions").iterdir())[
-            -2:
-        ]
-        to_delete.unlink()
-        return [
-            nodeid
-            for [nodeid] in sqlite3.connect(dbfile).execute(
-                "select nodeid from items where outcome in ('failed', 'error') order by nodeid"
-            )
-        ]
-
     def test_cache_cumulative(self, pytester: Pytester) -> None:
         """Test workflow where user fixes errors gradually file by file using --lf."""
         # 1. initial run
@@ -513,7 +476,7 @@ class TestLastFailed:
         """
         )
         pytester.runpytest()
-        assert self.get_cached_last_failed(pytester) == [
+        assert last_failed(pytester) == [
             "test_bar.py::test_bar_2",
             "test_foo.py::test_foo_4",
         ]
@@ -525,12 +488,10 @@ class TestLastFailed:
             def test_bar_2(): pass
         """
         )
-        result = pytester.runpytest(test_bar)
+        result = runq(pytester, test_bar)
         result.stdout.fnmatch_lines(["*2 passed*"])
         # ensure cache does not forget that test_foo_4 failed once before
-        assert self.get_cached_last_failed(pytester) == [
-            "test_foo.py::test_foo_4"
-        ]
+        assert last_failed(pytester) == ["test_foo.py::test_foo_4"]
 
         result = pytester.runpytest("--last-failed")
         result.stdout.fnmatch_lines(
@@ -541,9 +502,7 @@ class TestLastFailed:
                 "*= 1 failed*",
             ]
         )
-        assert self.get_cached_last_failed(pytester) == [
-            "test_foo.py::test_foo_4"
-        ]
+        assert last_failed(pytester) == ["test_foo.py::test_foo_4"]
 
         # 3. fix test_foo_4, run only test_foo.py
         test_foo = pytester.makepyfile(
@@ -560,11 +519,11 @@ class TestLastFailed:
                 "*= 1 passed, 1 deselected in *",
             ]
         )
-        assert self.get_cached_last_failed(pytester) == []
+        assert last_failed(pytester) == []
 
-        result = pytester.runpytest("--last-failed")
+        result = runq(pytester, "--last-failed")
         result.stdout.fnmatch_lines(["*4 passed*"])
-        assert self.get_cached_last_failed(pytester) == []
+        assert last_failed(pytester) == []
 
     def test_lastfailed_no_failures_behavior_all_passed(
         self,
@@ -576,11 +535,11 @@ class TestLastFailed:
             def test_2(): pass
         """
         )
-        result = pytester.runpytest()
+        result = runq(pytester)
         result.stdout.fnmatch_lines(["*2 passed*"])
-        result = pytester.runpytest("--lf")
+        result = runq(pytester, "--lf")
         result.stdout.fnmatch_lines(["*2 passed*"])
-        result = pytester.runpytest("--lf", "--lfnf", "all")
+        result = runq(pytester, "--lf", "--lfnf", "all")
         result.stdout.fnmatch_lines(["*2 passed*"])
 
         # Ensure the list passed to pytest_deselected is a copy,
@@ -619,11 +578,11 @@ class TestLastFailed:
             def test_2(): assert 0
         """
         )
-        result = pytester.runpytest("--lf", "--cache-clear")
-        result.stdout.fnmatch_lines(["*1 failed*1 passed*"])
-        result = pytester.runpytest("--lf", "--cache-clear", "--lfnf", "all")
-        result.stdout.fnmatch_lines(["*1 failed*1 passed*"])
-        result = pytester.runpytest("--lf", "--cache-clear", "--lfnf", "none")
+        reprec = pytester.inline_run("--lf", "--cache-clear")
+        reprec.assertoutcome(passed=1, failed=1)
+        reprec = pytester.inline_run("--lf", "--cache-clear", "--lfnf", "all")
+        reprec.assertoutcome(passed=1, failed=1)
+        result = runq(pytester, "--lf", "--cache-clear", "--lfnf", "none")
         result.stdout.fnmatch_lines(["*2 desel*"])
 
     def test_lastfailed_skip_collection(self, pytester: Pytester) -> None:
@@ -934,10 +893,8 @@ class TestLastFailed:
             python_files = *.py
             """
         )
-        result = pytester.runpytest()
-        result.assert_outcomes(failed=3)
-        result = pytester.runpytest("--lf")
-        result.assert_outcomes(failed=3)
+        pytester.inline_run().assertoutcome(failed=3)
+        pytester.inline_run("--lf").assertoutcome(failed=3)
 
     def test_non_python_file_skipped(
         self,
@@ -18,7 +18,7 @@ class TestNewFirst:
         )
 
         p1 = pytester.path.joinpath("test_1/test_1.py")
-        os.utime(p1, ns=(p1.stat().st_atime_ns, int(1e9)))
+        os.utime(p1, (1e9, 1e9))
 
         result = pytester.runpytest("-v")
         result.stdout.fnmatch_lines(
@@ -39,7 +39,7 @@ class TestNewFirst:
         p1.write_text(
             "def test_1(): assert 1\ndef test_2(): assert 1\n", encoding="utf-8"
         )
-        os.utime(p1, ns=(p1.stat().st_atime_ns, int(1e9)))
+        os.utime(p1, (1e9, 1e9))
 
         result = pytester.runpytest("--nf", "--collect-only", "-q")
         result.stdout.fnmatch_lines(
@@ -50,18 +50,15 @@ class TestNewFirst:
             ]
         )
 
-        # Newest first with (plugin) pytest_collection_modifyitems hook.
-        pytester.makepyfile(
-            myplugin="""
+        # Newest first with (conftest) pytest_collection_modifyitems hook.
+        pytester.makeconftest(
+            """
             def pytest_collection_modifyitems(items):
                 items[:] = sorted(items, key=lambda item: item.nodeid)
                 print("new_items:", [x.nodeid for x in items])
             """
         )
-        pytester.syspathinsert()
-        result = pytester.runpytest(
-            "--nf", "-p", "myplugin", "--collect-only", "-q"
-        )
+        result = pytester.runpytest("--nf", "--collect-only", "-q")
         result.stdout.fnmatch_lines(
             [
                 "new_items: *test_1.py*test_1.py*test_2.py*",
@@ -88,7 +85,7 @@ class TestNewFirst:
         )
 
         p1 = pytester.path.joinpath("test_1/test_1.py")
-        os.utime(p1, ns=(p1.stat().st_atime_ns, int(1e9)))
+        os.utime(p1, (1e9, 1e9))
 
         result = pytester.runpytest("-v")
         result.stdout.fnmatch_lines(
@@ -116,7 +113,7 @@ class TestNewFirst:
             "def test_1(num): assert num\n",
             encoding="utf-8",
         )  # fmt: skip
-        os.utime(p1, ns=(p1.stat().st_atime_ns, int(1e9)))
+        os.utime(p1, (1e9, 1e9))
 
         # Running only a subset does not forget about existing ones.
         result = pytester.runpytest("-v", "--nf", "test_2/test_2.py")
@@ -1,12 +1,21 @@
 """Basic recording features"""
 
 import json
+import math
+import pathlib
 import sqlite3
+from collections.abc import Callable
 
 import pytest
 
+from pytest_sessions import session_files, user_version
 
-def test_plugins_disabled(pytester: pytest.Pytester) -> None:
+
+def test_plugins_disabled(
+    pytester: pytest.Pytester,
+    sessions_dir: pathlib.Path,
+    session_db: Callable[[pathlib.Path], sqlite3.Connection],
+) -> None:
     pytester.makepyfile(
         """
         def test_plugins_disabled(pytestconfig):
@@ -18,8 +27,8 @@ def test_plugins_disabled(pytester: pytest.Pytester) -> None:
 
     pytester.runpytest()
 
-    f = next(pytester.path.joinpath('.pytest_cache', 'd', 'sessions').iterdir())
-    db = sqlite3.connect(f)
+    f = next(sessions_dir.iterdir())
+    db = session_db(f)
     assert db.execute("PRAGMA user_version").fetchone() == (5,)
     items = db.execute("SELECT nodeid, outcome FROM items").fetchall()
     # fmt:off
@@ -30,7 +39,11 @@ def test_plugins_disabled(pytester: pytest.Pytester) -> None:
     # fmt:on
 
 
-def test_outcomes(pytester: pytest.Pytester) -> None:
+def test_outcomes(
+    pytester: pytest.Pytester,
+    sessions_dir: pathlib.Path,
+    session_db: Callable[[pathlib.Path], sqlite3.Connection],
+) -> None:
     pytester.makepyfile(
         """\
 import pytest
@@ -64,8 +77,8 @@ def test_deselected():
 """
     )
     pytester.runpytest("-k", "not deselected")
-    f = next(pytester.path.joinpath('.pytest_cache', 'd', 'sessions').iterdir())
-    db = sqlite3.connect(f)
+    f = next(sessions_dir.iterdir())
+    db = session_db(f)
     items = db.execute("SELECT outcome FROM items order by nodeid").fetchall()
 
     assert items == [
@@ -79,7 +92,11 @@ def test_deselected():
     ]
 
 
-def test_cap(pytester: pytest.Pytester) -> None:
+def test_cap(
+    pytester: pytest.Pytester,
+    sessions_dir: pathlib.Path,
+    session_db: Callable[[pathlib.Path], sqlite3.Connection],
+) -> None:
     pytester.makepyfile(
         """
         import logging
@@ -102,14 +119,15 @@ def test_cap(pytester: pytest.Pytester) -> None:
 
     pytester.runpytest('--log-level=NOTSET')
 
-    f = next(pytester.path.joinpath('.pytest_cache', 'd', 'sessions').iterdir())
-    db = sqlite3.connect(f)
+    f = next(sessions_dir.iterdir())
+    db = session_db(f)
     assert db.execute("PRAGMA user_version").fetchone() == (5,)
     items = []
-    for outcome, call in db.execute(
-        "SELECT outcome, call FROM items order by nodeid"
+    for outcome, data in db.execute(
+        "SELECT outcome, json_extract(call, '$.sections') FROM items"
+        " ORDER BY nodeid"
     ):
-        sections = dict(json.loads(call)['sections'])
+        sections = dict(json.loads(data))
         items.append((
             outcome,
             sections.get('Captured log call', ''),
@@ -122,3 +140,79 @@ def test_cap(pytester: pytest.Pytester) -> None:
         ('passed', '', 'stdout\n', ''),
         ('warnings', '', '', ''),
     ]
+
+
+def test_interrupted(
+    pytester: pytest.Pytester,
+    sessions_dir: pathlib.Path,
+    session_db: Callable[[pathlib.Path], sqlite3.Connection],
+) -> None:
+    pytester.makepyfile(
+        """
+        def test_pass(): pass
+        def test_interrupt(): raise KeyboardInterrupt
+        def test_after(): pass
+    """
+    )
+
+    reprec = pytester.inline_run(no_reraise_ctrlc=True)
+    assert reprec.ret == pytest.ExitCode.INTERRUPTED
+
+    db = session_db(next(sessions_dir.iterdir()))
+    # the interrupted test never reaches `pytest_runtest_logfinish`, its
+    # row is only written when the session finishes, with what was
+    # reported so far
+    assert sorted(
+        db.execute("SELECT nodeid, outcome, setup IS NOT NULL FROM items")
+    ) == [
+        ("test_interrupted.py::test_after", "pending", 0),
+        ("test_interrupted.py::test_interrupt", "passed", 1),
+        ("test_interrupted.py::test_pass", "passed", 1),
+    ]
+
+
+def test_non_finite_properties(
+    pytester: pytest.Pytester,
+    sessions_dir: pathlib.Path,
+    session_db: Callable[[pathlib.Path], sqlite3.Connection],
+) -> None:
+    pytester.makepyfile(
+        """
+        def test_props(record_property):
+            record_property("nan", float("nan"))
+            record_property("inf", float("inf"))
+    """
+    )
+
+    pytester.runpytest().assert_outcomes(passed=1)
+
+    db = session_db(next(sessions_dir.iterdir()))
+    [(call,)] = db.execute("SELECT call FROM items")
+    [(_, nan), (_, inf)] = json.loads(call)['user_properties']
+    assert math.isnan(nan)
+    assert inf == math.inf
+
+
+def test_xdist(
+    pytester: pytest.Pytester,
+    sessions_dir: pathlib.Path,
+    session_db: Callable[[pathlib.Path], sqlite3.Connection],
+) -> None:
+    pytest.importorskip("xdist")
+    pytester.makepyfile(
+        """
+        def test_pass(): pass
+        def test_fail(): assert 0
+    """
+    )
+
+    pytester.runpytest("-n", "2").assert_outcomes(passed=1, failed=1)
+
+    # only the controller records the session
+    [f] = session_files(sessions_dir)
+    assert user_version(f) == 5
+    db = session_db(f)
+    assert sorted(db.execute("SELECT nodeid, outcome FROM items")) == [
+        ("test_xdist.py::test_fail", "failed"),
+        ("test_xdist.py::test_pass", "passed"),
+    ]
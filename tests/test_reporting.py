@@ -1,24 +1,33 @@
-import functools
+import json
+import pathlib
 import re
+import sqlite3
+from collections.abc import Callable
 
 import pytest
 
-CLEAN_COLLECTED_LINE = functools.partial(
-    re.compile(r"^collected .*\n", flags=re.MULTILINE).sub,
-    "",
-)
-CLEAN_FILE_LINE = functools.partial(
-    re.compile(r"^([\w\./-]+\s+\S+)\s+\[\d+%\]$", flags=re.MULTILINE).sub,
-    r"\1",
-)
-CLEAN_TIME = functools.partial(
-    re.compile(r"(in) \d+\.\d+s (=+)$").sub,
-    r"\1 X.XXs \2",
+# the variable parts of reports, cleaned in a single pass: collection
+# line, progress percentages, and duration (of the final summary only)
+NOISE = re.compile(
+    r"(?P<collected>^collected .*\n)"
+    r"|(?P<progress>^(?P<file>[\w\./-]+\s+\S+)\s+\[\d+%\]$)"
+    r"|(?P<time>(?-m:in \d+\.\d+s (?P<sep>=+)$))",
+    flags=re.MULTILINE,
 )
 
 
+def clean_noise(m: re.Match[str]) -> str:
+    match m.lastgroup:
+        case 'collected':
+            return ""
+        case 'progress':
+            return m['file']
+        case _:
+            return f"in X.XXs {m['sep']}"
+
+
 def clean_report(out: str) -> str:
-    return CLEAN_TIME(CLEAN_FILE_LINE(CLEAN_COLLECTED_LINE(out)))
+    return NOISE.sub(clean_noise, out)
 
 
 def test_show_session_bypass_execution(pytester: pytest.Pytester) -> None:
@@ -51,7 +60,11 @@ def test_show_session_simple(pytester: pytest.Pytester) -> None:
     result.stdout.fnmatch_lines(["*test_pass PASSED*", "*test_fail FAILED*"])
 
 
-def test_show_session_output(pytester: pytest.Pytester) -> None:
+def test_show_session_output(
+    pytester: pytest.Pytester,
+    sessions_dir: pathlib.Path,
+    session_db: Callable[[pathlib.Path], sqlite3.Connection],
+) -> None:
     pytester.makepyfile("""
         import sys
         def test_out():
@@ -61,10 +74,16 @@ def test_show_session_output(pytester: pytest.Pytester) -> None:
     """)
     original = pytester.runpytest('-rP')
 
-    # ensure the latest session does not use rP output, so we need to
-    # have stored the correct underlying data even though pytest
-    # didn't print it
-    pytester.runpytest()
+    # the replay must come from the stored report, not from what pytest
+    # printed
+    [f] = sessions_dir.iterdir()
+    [[sections]] = session_db(f).execute(
+        "SELECT json_extract(call, '$.sections') FROM items"
+    )
+    assert json.loads(sections) == [
+        ["Captured stdout call", "hello stdout\n"],
+        ["Captured stderr call", "hello stderr\n"],
+    ]
 
     reconstructed = pytester.runpytest("--show-session", "-rP")
 
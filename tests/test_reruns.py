@@ -2,6 +2,17 @@
 
 import pytest
 
+# tests a to d, those listed in $FAILING fail, so the stages only have
+# to change the environment rather than rewrite the file
+STEPWISE_TESTS = """
+import os
+
+def test_a(): assert 'a' not in os.environ['FAILING']
+def test_b(): assert 'b' not in os.environ['FAILING']
+def test_c(): assert 'c' not in os.environ['FAILING']
+def test_d(): assert 'd' not in os.environ['FAILING']
+"""
+
 
 def test_new(pytester: pytest.Pytester) -> None:
     pytester.makepyfile(
@@ -89,97 +100,34 @@ def test_d():
     ])  # fmt: skip
 
 
-def test_stepwisex(pytester: pytest.Pytester) -> None:
+def test_stepwisex(
+    pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+) -> None:
     params = ('-x', '--rerun', 'failed,pending')
-    pytester.makepyfile(
-        """
-def test_a(): assert 0
-def test_b(): assert 0
-def test_c(): assert 0
-def test_d(): assert 0
-"""
-    )
-    pytester.runpytest(*params).assert_outcomes(failed=1)
-
-    pytester.makepyfile(
-        """
-def test_a(): pass
-def test_b(): assert 0
-def test_c(): assert 0
-def test_d(): assert 0
-"""
-    )
-    pytester.runpytest(*params).assert_outcomes(passed=1, failed=1)
-
-    pytester.makepyfile(
-        """
-def test_a(): pass
-def test_b(): pass
-def test_c(): assert 0
-def test_d(): assert 0
-"""
-    )
-    pytester.runpytest(*params).assert_outcomes(passed=1, failed=1)
-
-    pytester.makepyfile(
-        """
-def test_a(): pass
-def test_b(): pass
-def test_c(): pass
-def test_d(): assert 0
-"""
-    )
-    pytester.runpytest(*params).assert_outcomes(passed=1, failed=1)
-
-    pytester.makepyfile(
-        """
-def test_a(): pass
-def test_b(): pass
-def test_c(): pass
-def test_d(): pass
-"""
-    )
-    pytester.runpytest(*params).assert_outcomes(passed=1)
-
-
-def test_stepwise_skip(pytester: pytest.Pytester) -> None:
+    stages: list[tuple[str, dict[str, int]]] = [
+        ("abcd", {"failed": 1}),
+        ("bcd", {"passed": 1, "failed": 1}),
+        ("cd", {"passed": 1, "failed": 1}),
+        ("d", {"passed": 1, "failed": 1}),
+        ("", {"passed": 1}),
+    ]
+    pytester.makepyfile(STEPWISE_TESTS)
+    for failing, outcomes in stages:
+        monkeypatch.setenv("FAILING", failing)
+        pytester.runpytest(*params).assert_outcomes(**outcomes)
+
+
+def test_stepwise_skip(
+    pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+) -> None:
     params = ('--maxfail', '2', '--rerun', 'failed,pending')
-    pytester.makepyfile(
-        """
-def test_a(): assert 0
-def test_b(): assert 0
-def test_c(): assert 0
-def test_d(): assert 0
-"""
-    )
-    pytester.runpytest(*params).assert_outcomes(failed=2)
-
-    pytester.makepyfile(
-        """
-def test_a(): pass
-def test_b(): assert 0
-def test_c(): assert 0
-def test_d(): assert 0
-"""
-    )
-    pytester.runpytest(*params).assert_outcomes(passed=1, failed=2)
-
-    pytester.makepyfile(
-        """
-def test_a(): pass
-def test_b(): pass
-def test_c(): pass
-def test_d(): assert 0
-"""
-    )
-    pytester.runpytest(*params).assert_outcomes(passed=2, failed=1)
-
-    pytester.makepyfile(
-        """
-def test_a(): pass
-def test_b(): pass
-def test_c(): pass
-def test_d(): pass
-"""
-    )
-    pytester.runpytest(*params).assert_outcomes(passed=1)
+    stages: list[tuple[str, dict[str, int]]] = [
+        ("abcd", {"failed": 2}),
+        ("bcd", {"passed": 1, "failed": 2}),
+        ("d", {"passed": 2, "failed": 1}),
+        ("", {"passed": 1}),
+    ]
+    pytester.makepyfile(STEPWISE_TESTS)
+    for failing, outcomes in stages:
+        monkeypatch.setenv("FAILING", failing)
+        pytester.runpytest(*params).assert_outcomes(**outcomes)
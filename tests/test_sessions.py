@@ -7,52 +7,60 @@ from typing import Callable
 import pytest
 
 
-def test_multiple_sessions(pytester: pytest.Pytester) -> None:
+def test_multiple_sessions(
+    pytester: pytest.Pytester, sessions_dir: pathlib.Path
+) -> None:
     pytester.makepyfile("def test_x(): pass")
 
     pytester.runpytest()
     pytester.runpytest()
 
-    sessions = list(
-        pytester.path.joinpath('.pytest_cache', 'd', 'sessions').iterdir()
-    )
-    assert len(sessions) == 2
+    assert len(list(sessions_dir.iterdir())) == 2
 
 
-def test_truncate(pytester: pytest.Pytester) -> None:
+def test_truncate(
+    pytester: pytest.Pytester, sessions_dir: pathlib.Path
+) -> None:
     pytester.makefile(".ini", pytest="[pytest]\nsessions_limit = 10")
 
     pytester.makepyfile("def test_x(): pass")
 
-    for _ in range(11):
-        pytester.runpytest()
+    pytester.runpytest()
+    [first] = sessions_dir.iterdir()
+    # pruning goes by name, so fabricate sessions older than the first
+    for i in range(10):
+        sessions_dir.joinpath(f'session-{i:020}').touch()
 
-    sessions = list(
-        pytester.path.joinpath('.pytest_cache', 'd', 'sessions').iterdir()
-    )
+    pytester.runpytest()
+
+    sessions = sorted(sessions_dir.iterdir())
     assert len(sessions) == 10
+    assert sessions[0].name == 'session-00000000000000000002'
+    assert first in sessions
 
 
-def test_save_session(pytester: pytest.Pytester) -> None:
+def test_save_session(
+    pytester: pytest.Pytester, sessions_dir: pathlib.Path
+) -> None:
     """A sessions copied away from the default"""
     pytester.makefile(".ini", pytest="[pytest]\nsessions_limit = 10")
     pytester.makepyfile("def test_x(): pass")
 
     pytester.runpytest()
-    sessionsdir = pytester.path.joinpath('.pytest_cache', 'd', 'sessions')
-    basefile = next(sessionsdir.iterdir())
+    basefile = next(sessions_dir.iterdir())
     assert basefile.stat().st_nlink == 1
-    save = sessionsdir.joinpath("saved")
+    save = sessions_dir.joinpath("saved")
     save.hardlink_to(basefile)
     assert basefile.stat().st_nlink == 2
 
-    for _ in range(20):
+    # just enough sessions for the base one to be pruned
+    for _ in range(10):
         pytester.runpytest()
 
     assert not basefile.is_file()
     assert save.is_file()
     assert save.stat().st_nlink == 1
-    assert sum(1 for _ in sessionsdir.iterdir()) == 11
+    assert sum(1 for _ in sessions_dir.iterdir()) == 11
 
 
 def _rename(s: pathlib.Path, _tmp: pathlib.Path) -> str:
@@ -74,6 +82,7 @@ def _tmpify(s: pathlib.Path, tmp: pathlib.Path) -> pathlib.Path:
 ])  # fmt: skip
 def test_reference(
     pytester: pytest.Pytester,
+    sessions_dir: pathlib.Path,
     tmp_path: pathlib.Path,
     sessionifier: Callable[[pathlib.Path, pathlib.Path], str | pathlib.Path],
 ) -> None:
@@ -85,9 +94,7 @@ def test_reference(
     result = pytester.runpytest()
     result.assert_outcomes(passed=1, failed=1)
 
-    sessions = sorted(
-        pytester.path.joinpath('.pytest_cache/d/sessions').glob('session-*')
-    )
+    sessions = sorted(sessions_dir.glob('session-*'))
     reference = sessionifier(sessions[-1], tmp_path)
 
     # fix test
@@ -7,7 +7,7 @@ from collections.abc import Sequence
 from pathlib import Path
 
 import pytest
-from pytest import Cache, MonkeyPatch, Pytester
+from pytest import Cache, Pytester
 from _pytest.stepwise import STEPWISE_CACHE_DIR
 
 
@@ -221,13 +221,11 @@ def test_stop_on_collection_errors(
     result.stdout.fnmatch_lines("*error during collection*")
 
 
-def test_xfail_handling(pytester: Pytester, monkeypatch: MonkeyPatch) -> None:
+def test_xfail_handling(pytester: Pytester) -> None:
     """Ensure normal xfail is ignored, and strict xfail interrupts the session in sw mode
 
     (#5547)
     """
-    monkeypatch.setattr("sys.dont_write_bytecode", True)
-
     contents = """
         import pytest
         def test_a(): pass